@@ -89,10 +89,11 @@ def activate_virtualenv_in_precommit_hooks(session: Session) -> None:
         if hook.name.endswith(".sample") or not hook.is_file():
             continue
 
-        if not hook.read_bytes().startswith(b"#!"):
+        data = hook.read_bytes()
+        if not data.startswith(b"#!"):
             continue
 
-        text = hook.read_text()
+        text = data.decode("utf-8")
 
         if not is_bindir_in_text(bindirs, text):
             continue
@@ -103,10 +104,12 @@ def activate_virtualenv_in_precommit_hooks(session: Session) -> None:
 
 def is_bindir_in_text(bindirs: list[str], text: str) -> bool:
     """Helper function to check if bindir is in text."""
-    return any(
-        Path("A") == Path("a") and bindir.lower() in text.lower() or bindir in text
-        for bindir in bindirs
-    )
+    if Path("A") == Path("a"):  # Case-insensitive file system paths, e.g. on Windows
+        text_lower = text.lower()
+        return any(
+            bindir.lower() in text_lower or bindir in text for bindir in bindirs
+        )
+    return any(bindir in text for bindir in bindirs)
 
 
 def insert_header_in_hook(header: dict[str, str], lines: list[str]) -> str:
@@ -14,20 +14,18 @@ from dapla_pseudo.v1 import pseudonymize
 (which would always resolve to the v1 implementation)
 """
 
-from importlib.metadata import version
+import importlib
+import typing as t
 
-# Avoid having to define the version multiple places.
-# Ref: https://github.com/python-poetry/poetry/issues/144#issuecomment-1488038660
-__version__ = version("dapla_toolbelt_pseudo")
-
-from dapla_pseudo.globberator.traverser import SchemaTraverser
-from dapla_pseudo.v1.client import PseudoClient
-from dapla_pseudo.v1.depseudo import Depseudonymize
-from dapla_pseudo.v1.models.core import PseudoKeyset
-from dapla_pseudo.v1.models.core import PseudoRule
-from dapla_pseudo.v1.pseudo import Pseudonymize
-from dapla_pseudo.v1.repseudo import Repseudonymize
-from dapla_pseudo.v1.validation import Validator
+if t.TYPE_CHECKING:
+    from dapla_pseudo.globberator.traverser import SchemaTraverser
+    from dapla_pseudo.v1.client import PseudoClient
+    from dapla_pseudo.v1.depseudo import Depseudonymize
+    from dapla_pseudo.v1.models.core import PseudoKeyset
+    from dapla_pseudo.v1.models.core import PseudoRule
+    from dapla_pseudo.v1.pseudo import Pseudonymize
+    from dapla_pseudo.v1.repseudo import Repseudonymize
+    from dapla_pseudo.v1.validation import Validator
 
 __all__ = [
     "Depseudonymize",
@@ -39,3 +37,36 @@ __all__ = [
     "SchemaTraverser",
     "Validator",
 ]
+
+# The public classes are imported on first access, so that importing e.g. dapla_pseudo.constants
+# does not pull in Polars, Pydantic and the HTTP clients.
+_LAZY_IMPORTS = {
+    "Depseudonymize": "dapla_pseudo.v1.depseudo",
+    "PseudoClient": "dapla_pseudo.v1.client",
+    "PseudoKeyset": "dapla_pseudo.v1.models.core",
+    "PseudoRule": "dapla_pseudo.v1.models.core",
+    "Pseudonymize": "dapla_pseudo.v1.pseudo",
+    "Repseudonymize": "dapla_pseudo.v1.repseudo",
+    "SchemaTraverser": "dapla_pseudo.globberator.traverser",
+    "Validator": "dapla_pseudo.v1.validation",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the public classes and resolve ``__version__`` on first access, not on import."""
+    if name in _LAZY_IMPORTS:
+        globals()[name] = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        return globals()[name]
+    if name == "__version__":
+        from importlib.metadata import version
+
+        # Avoid having to define the version multiple places.
+        # Ref: https://github.com/python-poetry/poetry/issues/144#issuecomment-1488038660
+        globals()[name] = version("dapla_toolbelt_pseudo")
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported classes, e.g. for autocompletion."""
+    return sorted({*globals(), *__all__})
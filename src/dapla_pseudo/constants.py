@@ -1,19 +1,16 @@
 """This module defines constants that are referenced throughout the codebase."""
 
 from enum import Enum
+from typing import Final
 
 TIMEOUT_DEFAULT: int = 10 * 60  # seconds
 
 
-class Env(str, Enum):
+class Env:
     """Environment variable keys."""
 
-    PSEUDO_SERVICE_URL = "PSEUDO_SERVICE_URL"
-    PSEUDO_SERVICE_AUTH_TOKEN = "PSEUDO_SERVICE_AUTH_TOKEN"  # S105
-
-    def __str__(self) -> str:
-        """Use value for string representation."""
-        return str(self.value)
+    PSEUDO_SERVICE_URL: Final[str] = "PSEUDO_SERVICE_URL"
+    PSEUDO_SERVICE_AUTH_TOKEN: Final[str] = "PSEUDO_SERVICE_AUTH_TOKEN"  # S105
 
 
 class PseudoOperation(str, Enum):
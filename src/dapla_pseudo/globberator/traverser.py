@@ -1,12 +1,39 @@
-from collections.abc import Generator
+import re
+from collections.abc import Iterator
+from pathlib import Path
 
-import msgspec
 import polars as pl
 from dapla.gcs import GCSFileSystem
+from pydantic import TypeAdapter
 from wcmatch import glob
 
 from dapla_pseudo.v1.models.core import PseudoRule
 
+GLOB_FLAGS = glob.GLOBSTAR | glob.BRACE
+# Glob syntax that ends the literal prefix of a pattern: wildcards, and escapes
+GLOB_WILDCARD_MATCHER = re.compile(r"[*?{\[\\]")
+GLOB_SEPARATORS_MATCHER = re.compile(r"/+")
+RULES_ADAPTER = TypeAdapter(list[PseudoRule])
+
+# (literal prefix, glob pattern translated to a regex, rule)
+_CompiledRule = tuple[str, str, PseudoRule]
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Get the part of a (lowercased) glob pattern that precedes the first wildcard.
+
+    Repeated separators are collapsed, like wcmatch does when matching the pattern.
+    """
+    prefix = GLOB_WILDCARD_MATCHER.split(pattern.lower(), maxsplit=1)[0]
+    return GLOB_SEPARATORS_MATCHER.sub("/", prefix).lstrip("/")
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """Read a whole (small) file, fetching GCS objects in a single request."""
+    if file_path.startswith("gs://"):
+        return GCSFileSystem().cat_file(file_path)  # type: ignore[no-any-return]
+    return Path(file_path).read_bytes()
+
 
 class SchemaTraverser:
     """Perform transformations and operations on a potentially nested Parquet schema."""
@@ -15,28 +42,46 @@ class SchemaTraverser:
         """Initialize the class."""
         self.schema = schema
         self.rules = rules
+        # Only the first rule with a given (case-insensitive) pattern can ever match a path
+        rule_by_pattern: dict[str, PseudoRule] = {}
+        for rule in rules:
+            rule_by_pattern.setdefault(rule.pattern.lower(), rule)
+        # Translate each unique glob pattern once, instead of per matched path
+        self._compiled_rules: list[_CompiledRule] = [
+            (
+                _literal_prefix(pattern),
+                "|".join(glob.translate(pattern, flags=GLOB_FLAGS)[0]),
+                rule,
+            )
+            for pattern, rule in rule_by_pattern.items()
+        ]
+        # Union regexes, keyed by the indices of the rules they cover
+        self._union_cache: dict[tuple[int, ...], re.Pattern[str]] = {}
+        # Identical Struct dtypes (which hash by value) share their field schema
+        self._schema_cache: dict[pl.DataType, dict[str, pl.DataType]] = {}
 
     @staticmethod
     def from_path(schema_path: str, rules_path: str) -> "SchemaTraverser":
         """Build a SchemaTraverser instance."""
+        # The schema is read from the Parquet footer, so open the (possibly large)
+        # data file rather than reading all of it
         schema_opener = (
             GCSFileSystem().open if schema_path.startswith("gs://") else open
         )
-        rules_opener = GCSFileSystem().open if rules_path.startswith("gs://") else open
         with schema_opener(schema_path, mode="rb") as schema_file:
             schema = pl.read_parquet_schema(schema_file)
-        with rules_opener(schema_path, mode="rb") as rules_file:
-            content = msgspec.json.decode(rules_file.read())
-            rules = [msgspec.convert(rule, PseudoRule) for rule in content]
+        rules = RULES_ADAPTER.validate_json(_read_bytes(rules_path))
 
         return SchemaTraverser(schema, rules)
 
     @staticmethod
     def write_rules(file_path: str, rules: list[PseudoRule]) -> None:
         """Write rules to file."""
-        opener = GCSFileSystem.open if file_path.startswith("gs://") else open
+        opener = GCSFileSystem().open if file_path.startswith("gs://") else open
         with opener(file_path, mode="wb") as rules_file:
-            rules_file.write(msgspec.json.encode(rules))
+            rules_file.write(
+                RULES_ADAPTER.dump_json(rules, by_alias=True, exclude_none=True)
+            )
 
     def match_rules(self, separator: str = "/") -> list[PseudoRule]:
         """Match a set of glob patterns.
@@ -44,18 +89,19 @@ class SchemaTraverser:
         Takes a set of PseudoRules *without* concrete paths, and
         maps the glob-patterns to a concrete /path/to/thing using the schema.
         """
-        return list(
-            SchemaTraverser._match_rules(self.schema, self.rules, "", separator)
-        )
+        matched_rules: list[PseudoRule] = []
+        # Depth-first traversal using an explicit stack of (fields, parent path, candidate rules).
+        # Iterating over the fields lazily keeps the matched rules in schema order.
+        stack: list[tuple[Iterator[tuple[str, pl.DataType]], str, tuple[int, ...]]] = [
+            (iter(self.schema.items()), "", tuple(range(len(self._compiled_rules))))
+        ]
+        while stack:
+            fields, prev_path, rules = stack[-1]
+            if (field := next(fields, None)) is None:
+                stack.pop()
+                continue
 
-    @staticmethod
-    def _match_rules(
-        schema: dict[str, pl.DataType],
-        rules: list[PseudoRule],
-        prev_path: str,
-        separator: str,
-    ) -> Generator[PseudoRule, None, None]:
-        for name, dtype in schema.items():
+            name, dtype = field
             # Example for Polars types:
             # dtype     = List[Struct[Int64]]
             # base_type = List
@@ -63,15 +109,23 @@ class SchemaTraverser:
             path = f"{prev_path}{separator}{name}".lstrip("/")  # remove leading /
             match base_type:
                 case pl.Struct:  # If struct, nest further
-                    yield from SchemaTraverser._match_rules(
-                        dtype.to_schema(), rules, path, separator  # type: ignore[attr-defined]
+                    stack.append(
+                        (
+                            iter(self._struct_schema(dtype).items()),
+                            path,
+                            self._candidate_rules(path, rules, separator),
+                        )
                     )
 
                 case pl.List | pl.Array:  # If list-like type, nest with the inner value
                     inner_type = dtype.inner  # type: ignore[attr-defined]
                     if inner_type == pl.Struct:
-                        yield from SchemaTraverser._match_rules(
-                            inner_type.to_schema(), rules, path, separator
+                        stack.append(
+                            (
+                                iter(self._struct_schema(inner_type).items()),
+                                path,
+                                self._candidate_rules(path, rules, separator),
+                            )
                         )
                     elif inner_type == pl.List or inner_type == pl.Array:
                         raise ValueError(
@@ -79,30 +133,54 @@ class SchemaTraverser:
                             Nested types within nested types are not supported"
                         )
                     else:  # If not nested type, match on rule
-                        if (
-                            rule := SchemaTraverser._match_rule(path, rules)
-                        ) is not None:
-                            yield PseudoRule(
-                                path=path,
-                                pattern=rule.pattern,
-                                func=rule.func,
-                                name=rule.name,
-                            )
+                        if (rule := self._match_rule(path.lower(), rules)) is not None:
+                            matched_rules.append(rule.model_copy(update={"path": path}))
                 case _:
-                    if (rule := SchemaTraverser._match_rule(path, rules)) is not None:
-                        yield PseudoRule(
-                            path=path,
-                            pattern=rule.pattern,
-                            func=rule.func,
-                            name=rule.name,
-                        )
+                    if (rule := self._match_rule(path.lower(), rules)) is not None:
+                        matched_rules.append(rule.model_copy(update={"path": path}))
 
-    @staticmethod
-    def _match_rule(path: str, rules: list[PseudoRule]) -> PseudoRule | None:
-        for rule in rules:
-            path = path.lstrip("/")  # remove leading /
-            if glob.globmatch(
-                path.lower(), rule.pattern.lower(), flags=glob.GLOBSTAR | glob.BRACE
-            ):
-                return rule
-        return None
+        return matched_rules
+
+    def _struct_schema(self, dtype: pl.DataType) -> dict[str, pl.DataType]:
+        """Get the field schema of a Struct dtype, reusing it for identical dtypes."""
+        if (schema := self._schema_cache.get(dtype)) is None:
+            schema = self._schema_cache[dtype] = dtype.to_schema()  # type: ignore[attr-defined]
+        return schema
+
+    def _candidate_rules(
+        self, path: str, rules: tuple[int, ...], separator: str
+    ) -> tuple[int, ...]:
+        """Narrow down the rules that may match anything below the given path.
+
+        A rule can only match below ``path`` if its literal prefix (the part of the pattern
+        before the first wildcard) and ``path`` agree on their common leading characters.
+        Rule order is preserved, since only the first matching rule is applied.
+        """
+        subtree = f"{path.lower()}{separator}"
+        return tuple(
+            index
+            for index in rules
+            if (prefix := self._compiled_rules[index][0]).startswith(subtree)
+            or subtree.startswith(prefix)
+        )
+
+    def _union_pattern(self, rules: tuple[int, ...]) -> re.Pattern[str]:
+        """Get a single regex matching any of the given rules, with one named group per rule.
+
+        Alternatives are tried in order, so the group that matches is the first matching rule.
+        """
+        if (pattern := self._union_cache.get(rules)) is None:
+            pattern = self._union_cache[rules] = re.compile(
+                "|".join(
+                    f"(?P<r{index}>{self._compiled_rules[index][1]})" for index in rules
+                )
+            )
+        return pattern
+
+    def _match_rule(self, path: str, rules: tuple[int, ...]) -> PseudoRule | None:
+        if not rules:
+            return None
+        path = path.lstrip("/")  # remove leading /
+        if (match := self._union_pattern(rules).match(path)) is None:
+            return None
+        return self._compiled_rules[int(match.lastgroup[1:])][2]  # type: ignore[index]
@@ -1,8 +1,8 @@
 """The models module contains base classes used by other models."""
 
-from humps import camelize
 from pydantic import BaseModel
 from pydantic import ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class APIModel(BaseModel):
@@ -13,10 +13,22 @@ class APIModel(BaseModel):
     model to JSON.
     """
 
-    model_config = ConfigDict(alias_generator=camelize, populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, populate_by_name=True, defer_build=True
+    )
 
     def to_json(self) -> str:
         """Convert the model to JSON using camelCase aliases and only including assigned values."""
         return self.model_dump_json(
             exclude_unset=True, exclude_none=True, by_alias=True
         )
+
+    def to_json_bytes(self) -> bytes:
+        """Convert the model to UTF-8 encoded JSON using camelCase aliases, leaving out None values.
+
+        Unlike ``to_json``, unset fields are only left out if they default to None, which is
+        the case for every optional field of the API models (this is checked by the tests).
+        """
+        return self.__pydantic_serializer__.to_json(
+            self, exclude_none=True, by_alias=True
+        )
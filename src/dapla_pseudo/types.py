@@ -18,7 +18,7 @@ BinaryFileDecl: TypeAlias = (
 
 DatasetDecl = pd.DataFrame | BinaryFileDecl | str | Path
 FileLikeDatasetDecl = BinaryFileDecl | str | Path
-FileSpecDecl = tuple[str | None, BinaryFileDecl | str, str]
+FileSpecDecl = tuple[str | None, BinaryFileDecl | str | bytes, str]
 # FileSpecDecl is derived from the "files" argument in multi-part requests from the "Requests"-library
 # The tuple semantically means: ('filename', fileobj, 'content_type')
 # See "files" in https://requests.readthedocs.io/en/latest/api/#requests.request
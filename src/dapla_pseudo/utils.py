@@ -12,7 +12,6 @@ import fsspec
 import orjson
 import polars as pl
 from dapla import FileClient
-from gcsfs.core import GCSFile
 from google.auth.exceptions import DefaultCredentialsError
 from pydantic import ValidationError
 
@@ -35,6 +34,7 @@ from dapla_pseudo.v1.models.core import PseudoConfig
 from dapla_pseudo.v1.models.core import PseudoKeyset
 from dapla_pseudo.v1.models.core import PseudoRule
 from dapla_pseudo.v1.models.core import RedactKeywordArgs
+from dapla_pseudo.v1.mutable_dataframe import FieldMatch
 from dapla_pseudo.v1.mutable_dataframe import MutableDataFrame
 from dapla_pseudo.v1.supported_file_format import FORMAT_TO_MIMETYPE_FUNCTION
 from dapla_pseudo.v1.supported_file_format import SupportedOutputFileFormat
@@ -44,24 +44,22 @@ def find_multipart_obj(obj_name: str, multipart_files_tuple: set[t.Any]) -> t.An
     """Find "multipart object" by name.
 
     The requests lib specifies multipart file arguments as file-tuples, such as
-    ('filename', fileobj, 'content_type')
-    This method searches a tuple of such file-tuples ((file-tuple1),...,(file-tupleN))
-    It returns the fileobj for the first matching file-tuple with a specified filename.
+    ('filename', fileobj, 'content_type'), each given with the name of its part:
+    (name, file-tuple)
+    This method searches a collection of such named file-tuples ((name1, file-tuple1),...,(nameN, file-tupleN))
+    It returns the fileobj for the first file-tuple with the specified name.
 
     Example:
     Given the multipart_files_tuple:
-    multipart_tuple = (('filename1', fileobj1, 'application/json'), ('filename2', fileobj2, 'application/json'))
+    multipart_tuple = (('data', ('data.json', fileobj1, 'application/json')), ('request', (None, fileobj2, 'application/json')))
 
     then
-    find_multipart_obj("filename2", multipart_tuple) -> fileobj
+    find_multipart_obj("request", multipart_tuple) -> fileobj2
     """
-    try:
-        matching_item = next(
-            item[1] for item in multipart_files_tuple if item[0] == obj_name
-        )
-        return matching_item[1]
-    except StopIteration:
-        return None
+    for name, file_tuple in multipart_files_tuple:
+        if name == obj_name:
+            return file_tuple[1]
+    return None
 
 
 def redact_field(
@@ -74,11 +72,9 @@ def redact_field(
     kwargs = t.cast(RedactKeywordArgs, request.pseudo_func.kwargs)
     if kwargs.placeholder is None:
         raise ValueError("Placeholder needs to be set for Redact")
-    data = [kwargs.placeholder for _ in request.values]
-    # The above operation could be vectorized using something like Polars,
-    # however - the redact functionality is used mostly teams that use hierarchical
-    # data, i.e. with very small lists. The overhead of
-    # creating a Polars Series is probably not worth it.
+    # Repeating the (immutable) placeholder is done in C, and is cheaper than
+    # creating a Polars Series, even for the large columns of tabular data.
+    data = [kwargs.placeholder] * len(request.values)
 
     metadata = RawPseudoMetadata(
         field_name=request.name,
@@ -86,12 +82,12 @@ def redact_field(
         metrics=[],
         datadoc=[
             {
-                "short_name": request.name.split("/")[-1],
+                "short_name": request.name.rpartition("/")[2],
                 "data_element_path": request.name.replace("/", "."),
                 "data_element_pattern": request.pattern,
                 "encryption_algorithm": "REDACT",
                 "encryption_algorithm_parameters": [
-                    request.pseudo_func.kwargs.model_dump(exclude_none=True)
+                    kwargs.model_dump(exclude_none=True)
                 ],
             }
         ],
@@ -103,11 +99,9 @@ def redact_field(
 def asyncio_loop_running() -> bool:
     """Determins whether asyncio has a running event loop."""
     try:
-        loop = asyncio.get_running_loop()
-        if loop.is_running():
-            return True
-        else:
-            return False
+        # Raises a RuntimeError if there is no running event loop
+        asyncio.get_running_loop()
+        return True
     except RuntimeError:
         return False
 
@@ -150,56 +144,55 @@ def build_pseudo_field_request(
     """Builds a FieldRequest object."""
     mutable_df.match_rules(rules, target_rules)
     matched_fields = mutable_df.get_matched_fields()
-    requests: list[PseudoFieldRequest | DepseudoFieldRequest | RepseudoFieldRequest] = (
-        []
-    )
-    req: PseudoFieldRequest | DepseudoFieldRequest | RepseudoFieldRequest
+    # The keyset is the same for every field, so only parse it once
+    keyset = KeyWrapper(custom_keyset).keyset
+
+    # Choose how to build the request once, rather than for every field
     match pseudo_operation:
-        case PseudoOperation.PSEUDONYMIZE:
-            for field in matched_fields.values():
-                try:
-                    req = PseudoFieldRequest(
-                        pseudo_func=field.func,
-                        name=field.path,
-                        pattern=field.pattern,
-                        values=field.get_value(),
-                        keyset=KeyWrapper(custom_keyset).keyset,
-                    )
-                    requests.append(req)
-                except ValidationError as e:
-                    raise Exception(f"Path or column: {field.path}") from e
-        case PseudoOperation.DEPSEUDONYMIZE:
-            for field in matched_fields.values():
-                try:
-                    req = DepseudoFieldRequest(
-                        pseudo_func=field.func,
-                        name=field.path,
-                        pattern=field.pattern,
-                        values=field.get_value(),
-                        keyset=KeyWrapper(custom_keyset).keyset,
-                    )
-                    requests.append(req)
-                except ValidationError as e:
-                    raise Exception(f"Path or column: {field.path}") from e
+        case PseudoOperation.PSEUDONYMIZE | PseudoOperation.DEPSEUDONYMIZE:
+            request_type = (
+                PseudoFieldRequest
+                if pseudo_operation == PseudoOperation.PSEUDONYMIZE
+                else DepseudoFieldRequest
+            )
+
+            def build_request(
+                field: FieldMatch,
+            ) -> PseudoFieldRequest | DepseudoFieldRequest | RepseudoFieldRequest:
+                return request_type(
+                    pseudo_func=field.func,
+                    name=field.path,
+                    pattern=field.pattern,
+                    values=field.get_value(),
+                    keyset=keyset,
+                )
 
         case PseudoOperation.REPSEUDONYMIZE:
-            if target_rules is not None:
-                for field in matched_fields.values():
-                    try:
-                        req = RepseudoFieldRequest(
-                            source_pseudo_func=field.func,
-                            target_pseudo_func=field.target_func,
-                            name=field.path,
-                            pattern=field.pattern,
-                            values=field.get_value(),
-                            source_keyset=KeyWrapper(custom_keyset).keyset,
-                            target_keyset=KeyWrapper(target_custom_keyset).keyset,
-                        )
-                        requests.append(req)
-                    except ValidationError as e:
-                        raise Exception(f"Path or column: {field.path}") from e
-            else:
+            if target_rules is None:
                 raise ValueError("Found no target rules")
+            target_keyset = KeyWrapper(target_custom_keyset).keyset
+
+            def build_request(
+                field: FieldMatch,
+            ) -> PseudoFieldRequest | DepseudoFieldRequest | RepseudoFieldRequest:
+                return RepseudoFieldRequest(
+                    source_pseudo_func=field.func,
+                    target_pseudo_func=field.target_func,
+                    name=field.path,
+                    pattern=field.pattern,
+                    values=field.get_value(),
+                    source_keyset=keyset,
+                    target_keyset=target_keyset,
+                )
+
+    requests: list[PseudoFieldRequest | DepseudoFieldRequest | RepseudoFieldRequest] = (
+        []
+    )
+    for field in matched_fields.values():
+        try:
+            requests.append(build_request(field))
+        except ValidationError as e:
+            raise Exception(f"Path or column: {field.path}") from e
     return requests
 
 
@@ -291,8 +284,10 @@ def get_file_data_from_dataset(
         # Convert Polars dataframe to a zipped archive with json data
         case pl.DataFrame() as df:
             file_handle = io.BytesIO()
+            # The fastest compression level, since deflating the JSON takes longer than
+            # uploading the (somewhat larger) archive
             with zipfile.ZipFile(
-                file_handle, "a", compression=zipfile.ZIP_DEFLATED, compresslevel=9
+                file_handle, "a", compression=zipfile.ZIP_DEFLATED, compresslevel=1
             ) as zip_file:
                 zip_file.writestr("data.json", orjson.dumps(df.to_dicts()))
                 zip_file.filename = "data.zip"
@@ -313,8 +308,10 @@ def get_file_data_from_dataset(
                 f"Unsupported data type: {type(dataset)}. Supported types are {FileLikeDatasetDecl}"
             )
 
-    if isinstance(file_handle, GCSFile):
-        file_size = file_handle.size
+    # Remote files know their size from the metadata fetched when they were opened,
+    # and are not backed by a file descriptor
+    if (remote_file := _remote_file(file_handle)) is not None:
+        file_size = remote_file.size
     else:
         file_size = os.fstat(file_handle.fileno()).st_size
 
@@ -337,8 +334,8 @@ def get_content_type_from_file(file_handle: BinaryFileDecl) -> Mimetypes:
     Returns:
         Mimetypes: The Mimetype of the file.
     """
-    if isinstance(file_handle, GCSFile):
-        file_name = file_handle.full_name
+    if (remote_file := _remote_file(file_handle)) is not None:
+        file_name = remote_file.full_name
     else:
         file_name = file_handle.name
     file_format = get_file_format_from_file_name(file_name)
@@ -350,3 +347,16 @@ def get_content_type_from_file(file_handle: BinaryFileDecl) -> Mimetypes:
         ) from None
 
     return content_type
+
+
+def _remote_file(
+    file_handle: BinaryFileDecl,
+) -> fsspec.spec.AbstractBufferedFile | None:
+    """Get the remote (e.g. GCS) file behind a file handle, if there is one.
+
+    fsspec file handles are wrapped in a BufferedReader by get_file_data_from_dataset.
+    """
+    raw_file = getattr(file_handle, "raw", file_handle)
+    if isinstance(raw_file, fsspec.spec.AbstractBufferedFile):
+        return raw_file
+    return None
@@ -1,12 +1,16 @@
 """Pseudo Service version 1 implementation."""
 
-from dapla_pseudo.v1.client import PseudoClient
-from dapla_pseudo.v1.depseudo import Depseudonymize
-from dapla_pseudo.v1.models.core import PseudoKeyset
-from dapla_pseudo.v1.models.core import PseudoRule
-from dapla_pseudo.v1.pseudo import Pseudonymize
-from dapla_pseudo.v1.repseudo import Repseudonymize
-from dapla_pseudo.v1.validation import Validator
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from dapla_pseudo.v1.client import PseudoClient
+    from dapla_pseudo.v1.depseudo import Depseudonymize
+    from dapla_pseudo.v1.models.core import PseudoKeyset
+    from dapla_pseudo.v1.models.core import PseudoRule
+    from dapla_pseudo.v1.pseudo import Pseudonymize
+    from dapla_pseudo.v1.repseudo import Repseudonymize
+    from dapla_pseudo.v1.validation import Validator
 
 __all__ = [
     "Depseudonymize",
@@ -17,3 +21,27 @@ __all__ = [
     "Repseudonymize",
     "Validator",
 ]
+
+# Imported on first access, see dapla_pseudo/__init__.py
+_LAZY_IMPORTS = {
+    "Depseudonymize": "dapla_pseudo.v1.depseudo",
+    "PseudoClient": "dapla_pseudo.v1.client",
+    "PseudoKeyset": "dapla_pseudo.v1.models.core",
+    "PseudoRule": "dapla_pseudo.v1.models.core",
+    "Pseudonymize": "dapla_pseudo.v1.pseudo",
+    "Repseudonymize": "dapla_pseudo.v1.repseudo",
+    "Validator": "dapla_pseudo.v1.validation",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the public classes on first access, not on import."""
+    if name in _LAZY_IMPORTS:
+        globals()[name] = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported classes, e.g. for autocompletion."""
+    return sorted({*globals(), *__all__})
@@ -166,7 +166,7 @@ class _BasePseudonymizer:
         content_type = self._dataset.content_type
         request_spec: FileSpecDecl = (
             None,
-            pseudo_request.to_json(),
+            pseudo_request.to_json_bytes(),
             str(Mimetypes.JSON),
         )
 
@@ -102,7 +102,7 @@ class PseudoClient:
                         "Content-Type": Mimetypes.JSON.value,
                         "X-Correlation-Id": PseudoClient._generate_new_correlation_id(),
                     },
-                    json={"request": request.model_dump(by_alias=True)},
+                    data=_field_request_body(request),
                     timeout=timeout,
                 ) as response:
                     await PseudoClient._handle_response_error(response)
@@ -167,7 +167,7 @@ class PseudoClient:
                         "Content-Type": Mimetypes.JSON.value,
                         "X-Correlation-Id": PseudoClient._generate_new_correlation_id(),
                     },
-                    json={"request": request.model_dump(by_alias=True)},
+                    data=_field_request_body(request),
                     timeout=timeout,
                 )
                 payload = msgspec.json.decode(response.content.decode("utf-8"))
@@ -291,6 +291,19 @@ def _extract_name(file_handle: t.BinaryIO, input_content_type: Mimetypes) -> str
     return name
 
 
+def _field_request_body(
+    request: PseudoFieldRequest | DepseudoFieldRequest | RepseudoFieldRequest,
+) -> bytes:
+    """Serialize a field request to the JSON body expected by the field endpoints.
+
+    The request is encoded directly to bytes by pydantic, instead of being dumped to a
+    dict and then re-encoded by the HTTP client.
+    """
+    return b'{"request":%b}' % request.__pydantic_serializer__.to_json(
+        request, by_alias=True
+    )
+
+
 def _client() -> PseudoClient:
     return PseudoClient(
         pseudo_service_url=os.getenv(Env.PSEUDO_SERVICE_URL),
@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from datetime import date
 from enum import Enum
 
-from humps import camelize
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
@@ -13,6 +12,7 @@ from pydantic import ValidationError
 from pydantic import field_serializer
 from pydantic import model_serializer
 from pydantic import model_validator
+from pydantic.alias_generators import to_camel
 
 from dapla_pseudo.constants import MapFailureStrategy
 from dapla_pseudo.constants import PredefinedKeys
@@ -46,13 +46,14 @@ class PseudoFunctionArgs(BaseModel):
 
     def __str__(self) -> str:
         """As a default, represent the fields of the subclasses as kwargs on the format 'k=v'."""
+        # Read the fields directly, instead of building a throwaway dict with model_dump
         return ",".join(
-            f"{k}={v}"
-            for k, v in self.model_dump(by_alias=True).items()
-            if v is not None
+            f"{field.alias or name}={value}"
+            for name, field in type(self).model_fields.items()
+            if (value := getattr(self, name)) is not None
         )
 
-    model_config = ConfigDict(alias_generator=camelize, populate_by_name=True)
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
 
 class MapSidKeywordArgs(PseudoFunctionArgs):
@@ -93,6 +94,17 @@ class RedactKeywordArgs(PseudoFunctionArgs):
     regex: str | None = None
 
 
+KEYWORD_ARGS_BY_FUNCTION_TYPE: dict[
+    PseudoFunctionTypes,
+    type[DaeadKeywordArgs | FF31KeywordArgs | MapSidKeywordArgs | RedactKeywordArgs],
+] = {
+    PseudoFunctionTypes.DAEAD: DaeadKeywordArgs,
+    PseudoFunctionTypes.REDACT: RedactKeywordArgs,
+    PseudoFunctionTypes.FF31: FF31KeywordArgs,
+    PseudoFunctionTypes.MAP_SID: MapSidKeywordArgs,
+}
+
+
 class PseudoFunction(BaseModel):
     """Formal representation of a pseudo function.
 
@@ -148,31 +160,8 @@ class PseudoFunction(BaseModel):
     def _resolve_args(
         cls, pseudo_function_type: PseudoFunctionTypes, args: dict[str, str] | None
     ) -> DaeadKeywordArgs | FF31KeywordArgs | MapSidKeywordArgs | RedactKeywordArgs:
-        match pseudo_function_type:
-            case PseudoFunctionTypes.DAEAD:
-                return (
-                    DaeadKeywordArgs()
-                    if args is None
-                    else DaeadKeywordArgs.model_validate(args)
-                )
-            case PseudoFunctionTypes.REDACT:
-                return (
-                    RedactKeywordArgs()
-                    if args is None
-                    else RedactKeywordArgs.model_validate(args)
-                )
-            case PseudoFunctionTypes.FF31:
-                return (
-                    FF31KeywordArgs()
-                    if args is None
-                    else FF31KeywordArgs.model_validate(args)
-                )
-            case PseudoFunctionTypes.MAP_SID:
-                return (
-                    MapSidKeywordArgs()
-                    if args is None
-                    else MapSidKeywordArgs.model_validate(args)
-                )
+        keyword_args = KEYWORD_ARGS_BY_FUNCTION_TYPE[pseudo_function_type]
+        return keyword_args() if args is None else keyword_args.model_validate(args)
 
 
 class PseudoRule(APIModel):
@@ -207,7 +196,8 @@ class PseudoRule(APIModel):
     def from_json(cls, data: str | dict[str, t.Any]) -> t.Any:
         """Deserialise the json-formatted pseudo rule to Python model."""
         if isinstance(data, str):
-            return super().model_validate(json.loads(data))
+            # Parse and validate in one pass, without building an intermediate dict
+            return super().model_validate_json(data)
         else:
             return super().model_validate(data)
 
@@ -254,6 +244,9 @@ class TargetCompression(APIModel):
     password: str
 
 
+PREDEFINED_KEYS = frozenset(key.value for key in PredefinedKeys)
+
+
 class KeyWrapper(BaseModel):
     """Hold information about a key, such as ID and keyset information."""
 
@@ -269,7 +262,13 @@ class KeyWrapper(BaseModel):
         """
         super().__init__(**kwargs)
         if isinstance(key, str):
-            try:  # Attempt to parse the key as a JSON-string matching the PseudoKeyset model
+            # Predefined keys are the common case, so look for them before parsing JSON
+            if key in PREDEFINED_KEYS:
+                self.key_id = key
+                self.keyset = None
+                return
+
+            try:  # Else, attempt to parse the key as a JSON-string matching the PseudoKeyset model
                 pseudo_keyset = PseudoKeyset.model_validate(json.loads(key))
                 self.key_id = pseudo_keyset.get_key_id()
                 self.keyset = pseudo_keyset
@@ -277,12 +276,7 @@ class KeyWrapper(BaseModel):
             except (ValidationError, json.JSONDecodeError):
                 pass
 
-            # Else, attempt to parse the key as one of the predefined keys
-            if key in PredefinedKeys.__members__.values():
-                self.key_id = key
-                self.keyset = None
-            else:
-                raise ValueError(f"Key '{key}' is not a valid key reference or keyset")
+            raise ValueError(f"Key '{key}' is not a valid key reference or keyset")
         # Or we have an already parsed PseudoKeyset
         elif isinstance(key, PseudoKeyset):
             self.key_id = key.get_key_id()
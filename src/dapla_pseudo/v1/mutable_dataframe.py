@@ -81,7 +81,8 @@ class MutableDataFrame:
                 str(i): FieldMatch(
                     path=rule.pattern,
                     pattern=rule.pattern,
-                    col=list(self.dataset.get_column(rule.pattern)),
+                    # Convert the whole column in Polars, not element by element
+                    col=self.dataset.get_column(rule.pattern).to_list(),
                     func=rule.func,
                     target_func=target_rule.func if target_rule else None,
                 )
@@ -13,6 +13,7 @@ from dapla import AuthClient
 from datadoc_model.model import MetadataContainer
 from datadoc_model.model import PseudonymizationMetadata
 from datadoc_model.model import PseudoVariable
+from pydantic import TypeAdapter
 
 from dapla_pseudo.utils import get_file_format_from_file_name
 from dapla_pseudo.v1.models.api import PseudoFieldResponse
@@ -21,6 +22,8 @@ from dapla_pseudo.v1.supported_file_format import SupportedOutputFileFormat
 from dapla_pseudo.v1.supported_file_format import write_from_df
 from dapla_pseudo.v1.supported_file_format import write_from_dicts
 
+PSEUDO_VARIABLES_ADAPTER = TypeAdapter(list[PseudoVariable])
+
 
 class Result:
     """Result represents the result of a pseudonymization operation."""
@@ -73,9 +76,9 @@ class Result:
                     "logs": file_metadata.logs,
                     "metrics": file_metadata.metrics,
                 }
-                pseudo_variables = list(
-                    PseudoVariable.model_validate(item)
-                    for item in file_metadata.datadoc
+                # Validate all the variables in a single call to pydantic-core
+                pseudo_variables = PSEUDO_VARIABLES_ADAPTER.validate_python(
+                    file_metadata.datadoc
                 )
                 self._datadoc = MetadataContainer(
                     pseudonymization=PseudonymizationMetadata(
@@ -1,6 +1,5 @@
 """Classes used to support reading of dataframes from file."""
 
-import json
 import typing as t
 from enum import Enum
 from io import BufferedWriter
@@ -8,6 +7,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pandas as pd
 import polars as pl
 
@@ -100,7 +100,7 @@ def write_from_dicts(
             df = pl.DataFrame(data)
             df.write_csv(file_like)
         case SupportedOutputFileFormat.JSON:
-            file_like.write(bytes(json.dumps(data), encoding="utf-8"))
+            file_like.write(orjson.dumps(data))
         case SupportedOutputFileFormat.XML:
             df_pandas = pd.DataFrame.from_records(data)
             df_pandas.to_xml(file_like)
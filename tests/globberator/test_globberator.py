@@ -1,4 +1,6 @@
+import json
 from collections import OrderedDict
+from pathlib import Path
 
 import polars as pl
 
@@ -61,3 +63,124 @@ def test_schema_traverser() -> None:
             }
         ),
     ]
+
+
+def test_schema_traverser_brace_pattern_case_insensitive() -> None:
+    schema = {
+        "identifiers": pl.Struct({"FNR": pl.String, "dnr": pl.String}),
+        "fornavn": pl.String,
+    }
+    rules = [
+        PseudoRule.from_json(
+            {"pattern": "**/{fnr,DNR}", "func": "redact(placeholder=#)"}
+        )
+    ]
+
+    concrete_rules = SchemaTraverser(schema=schema, rules=rules).match_rules()
+
+    assert [rule.path for rule in concrete_rules] == [
+        "identifiers/FNR",
+        "identifiers/dnr",
+    ]
+
+
+def test_schema_traverser_literal_prefix_pattern() -> None:
+    schema = {
+        "identifiers": pl.Struct({"fnr": pl.String}),
+        "names": pl.List(pl.Struct({"fnr": pl.String})),
+        "fnr": pl.String,
+    }
+    rules = [
+        PseudoRule.from_json({"pattern": "identifiers/fnr", "func": "daead()"}),
+        PseudoRule.from_json({"pattern": "nam*/fnr", "func": "ff31()"}),
+    ]
+
+    concrete_rules = SchemaTraverser(schema=schema, rules=rules).match_rules()
+
+    assert [(rule.path, rule.pattern) for rule in concrete_rules] == [
+        ("identifiers/fnr", "identifiers/fnr"),
+        ("names/fnr", "nam*/fnr"),
+    ]
+
+
+def test_write_rules(tmp_path: Path) -> None:
+    rules = [
+        PseudoRule.from_json(
+            {"name": "my-rule", "pattern": "**/fnr", "func": "redact(placeholder=#)"}
+        ),
+        PseudoRule.from_json(
+            {"pattern": "**/dnr", "path": "identifiers/dnr", "func": "daead()"}
+        ),
+    ]
+    rules_path = tmp_path / "rules.json"
+
+    SchemaTraverser.write_rules(str(rules_path), rules)
+
+    assert [
+        PseudoRule.from_json(rule) for rule in json.loads(rules_path.read_text())
+    ] == rules
+
+
+def test_from_path(tmp_path: Path) -> None:
+    schema_path = tmp_path / "data.parquet"
+    rules_path = tmp_path / "rules.json"
+    pl.DataFrame({"identifiers": [{"fnr": "11854898347"}]}).write_parquet(schema_path)
+    rules = [PseudoRule.from_json({"pattern": "**/fnr", "func": "daead()"})]
+    SchemaTraverser.write_rules(str(rules_path), rules)
+
+    sc = SchemaTraverser.from_path(str(schema_path), str(rules_path))
+
+    assert sc.schema == {"identifiers": pl.Struct({"fnr": pl.String})}
+    assert sc.rules == rules
+
+
+def test_schema_traverser_duplicate_patterns_first_rule_wins() -> None:
+    schema = {"fnr": pl.String, "dnr": pl.String}
+    rules = [
+        PseudoRule.from_json({"name": "first", "pattern": "fnr", "func": "daead()"}),
+        PseudoRule.from_json({"name": "second", "pattern": "FNR", "func": "ff31()"}),
+        PseudoRule.from_json({"name": "third", "pattern": "dnr", "func": "ff31()"}),
+    ]
+
+    concrete_rules = SchemaTraverser(schema=schema, rules=rules).match_rules()
+
+    assert [(rule.path, rule.name) for rule in concrete_rules] == [
+        ("fnr", "first"),
+        ("dnr", "third"),
+    ]
+
+
+def test_schema_traverser_overlapping_patterns_first_rule_wins() -> None:
+    schema = {"identifiers": pl.Struct({"fnr": pl.String}), "fnr": pl.String}
+    rules = [
+        PseudoRule.from_json({"name": "exact", "pattern": "fnr", "func": "daead()"}),
+        PseudoRule.from_json({"name": "any", "pattern": "**/fnr", "func": "ff31()"}),
+        PseudoRule.from_json(
+            {"name": "nested", "pattern": "identifiers/fnr", "func": "daead()"}
+        ),
+    ]
+
+    concrete_rules = SchemaTraverser(schema=schema, rules=rules).match_rules()
+
+    assert [(rule.path, rule.name) for rule in concrete_rules] == [
+        ("identifiers/fnr", "any"),
+        ("fnr", "exact"),
+    ]
+
+
+def test_schema_traverser_repeated_separator_in_pattern() -> None:
+    schema = {"a b": pl.Struct({"a": pl.Struct({"fnr": pl.String})})}
+    rules = [PseudoRule.from_json({"pattern": "a b//a/{fnr,ab*}", "func": "daead()"})]
+
+    concrete_rules = SchemaTraverser(schema=schema, rules=rules).match_rules()
+
+    assert [rule.path for rule in concrete_rules] == ["a b/a/fnr"]
+
+
+def test_schema_traverser_escaped_separator_in_pattern() -> None:
+    schema = {"a": pl.Struct({"fnr": pl.String})}
+    rules = [PseudoRule.from_json({"pattern": "a\\/fnr", "func": "daead()"})]
+
+    concrete_rules = SchemaTraverser(schema=schema, rules=rules).match_rules()
+
+    assert [rule.path for rule in concrete_rules] == ["a/fnr"]
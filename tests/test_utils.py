@@ -1,8 +1,14 @@
+import json
+import zipfile
 from datetime import date
+from datetime import datetime
+from datetime import time
 from unittest.mock import Mock
 
+import fsspec
 import polars as pl
 import pytest
+from fsspec.spec import AbstractBufferedFile
 from gcsfs.core import GCSFile
 from google.auth.exceptions import DefaultCredentialsError
 
@@ -17,6 +23,7 @@ from dapla_pseudo.utils import find_multipart_obj
 from dapla_pseudo.utils import get_content_type_from_file
 from dapla_pseudo.utils import get_file_data_from_dataset
 from dapla_pseudo.utils import get_file_format_from_file_name
+from dapla_pseudo.v1.models.api import DepseudoFieldRequest
 from dapla_pseudo.v1.models.api import PseudoFieldRequest
 from dapla_pseudo.v1.models.api import RepseudoFieldRequest
 from dapla_pseudo.v1.models.core import DaeadKeywordArgs
@@ -127,12 +134,39 @@ def test_get_file_data_from_invalid_gcs_file() -> None:
         get_file_data_from_dataset(invalid_gcs_path)
 
 
+def test_get_file_data_from_fsspec_file() -> None:
+    class InMemoryFile(AbstractBufferedFile):
+        def _fetch_range(self, start: int, end: int) -> bytes:
+            return b'{"foo": "bar"}'[start:end]
+
+    fs = fsspec.filesystem("memory")
+    file_handle = InMemoryFile(fs, "bucket/data.json", mode="rb", size=14)
+
+    _, mime_type = get_file_data_from_dataset(file_handle)
+    assert mime_type == Mimetypes.JSON
+
+
 def test_get_file_data_from_polars_dataset() -> None:
     df = pl.DataFrame()
     _, mime_type = get_file_data_from_dataset(df)
     assert mime_type.name == "ZIP"
 
 
+def test_get_file_data_from_polars_dataset_with_temporal_columns() -> None:
+    df = pl.DataFrame(
+        {
+            "timestamp": [datetime(2020, 1, 2, 3, 4, 5)],
+            "time": [time(3, 4, 5)],
+        }
+    ).with_columns(pl.col("timestamp").dt.replace_time_zone("Europe/Oslo"))
+
+    file_handle, _ = get_file_data_from_dataset(df)
+
+    with zipfile.ZipFile(file_handle) as zip_file:
+        data = json.loads(zip_file.read("data.json"))
+    assert data == [{"timestamp": "2020-01-02T03:04:05+01:00", "time": "03:04:05"}]
+
+
 def test_build_pseudo_field_request() -> None:
     data = [
         {"foo": "bar", "struct": {"foo": "baz"}},
@@ -170,6 +204,33 @@ def test_build_pseudo_field_request() -> None:
     ]
 
 
+def test_build_depseudo_field_request() -> None:
+    df = MutableDataFrame(pl.DataFrame({"foo": ["bar", "baz"]}), hierarchical=False)
+    rules = [PseudoRule.from_json('{"pattern":"foo","func":"daead(keyId=my-key)"}')]
+
+    requests = build_pseudo_field_request(PseudoOperation.DEPSEUDONYMIZE, df, rules)
+
+    assert requests == [
+        DepseudoFieldRequest(
+            pseudo_func=PseudoFunction(
+                function_type=PseudoFunctionTypes.DAEAD,
+                kwargs=DaeadKeywordArgs(key_id="my-key"),
+            ),
+            name="foo",
+            pattern="/foo",
+            values=["bar", "baz"],
+        )
+    ]
+
+
+def test_build_repseudo_field_request_without_target_rules() -> None:
+    df = MutableDataFrame(pl.DataFrame({"foo": ["bar", "baz"]}), hierarchical=False)
+    rules = [PseudoRule.from_json('{"pattern":"foo","func":"daead(keyId=my-key)"}')]
+
+    with pytest.raises(ValueError, match="Found no target rules"):
+        build_pseudo_field_request(PseudoOperation.REPSEUDONYMIZE, df, rules)
+
+
 def test_build_repseudo_field_request() -> None:
     data = [
         {"foo": "bar", "struct": {"foo": "baz"}},
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import ANY
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -53,8 +54,14 @@ async def test_post_to_field_endpoint_success(
 
     mocker.patch(f"{PKG}.RetryClient.post", return_value=mock_request_context)
 
-    mock_pseudo_field_request = Mock(spec=PseudoFieldRequest)
-    mock_pseudo_field_request.name = "magic"
+    mock_pseudo_field_request = PseudoFieldRequest(
+        pseudo_func=PseudoFunction(
+            function_type=PseudoFunctionTypes.DAEAD, kwargs=DaeadKeywordArgs()
+        ),
+        name="magic",
+        pattern="magic",
+        values=[],
+    )
 
     results = await test_client.post_to_field_endpoint(
         path="test_path",
@@ -89,8 +96,14 @@ async def test_post_to_field_endpoint_failure(
         f"{PKG}.RetryClient.post", return_value=mock_request_context
     )
 
-    mock_pseudo_field_request = Mock(spec=PseudoFieldRequest)
-    mock_pseudo_field_request.name = "magic"
+    mock_pseudo_field_request = PseudoFieldRequest(
+        pseudo_func=PseudoFunction(
+            function_type=PseudoFunctionTypes.DAEAD, kwargs=DaeadKeywordArgs()
+        ),
+        name="magic",
+        pattern="magic",
+        values=[],
+    )
 
     with pytest.raises(ClientResponseError):
         await test_client.post_to_field_endpoint(
@@ -125,7 +138,9 @@ async def test_post_to_field_endpoint_serialization(
         pseudo_requests=[pseudo_field_request],
         timeout=TIMEOUT_DEFAULT,
     )
-    expected_json = {"request": pseudo_field_request.model_dump(by_alias=True)}
+    expected_json = {
+        "request": pseudo_field_request.model_dump(mode="json", by_alias=True)
+    }
 
     mock_post.assert_called_once_with(
         url="https://mocked.dapla-pseudo-service/test_path",
@@ -134,9 +149,10 @@ async def test_post_to_field_endpoint_serialization(
             "Content-Type": "application/json",
             "X-Correlation-Id": ANY,
         },
-        json=expected_json,
+        data=ANY,
         timeout=TIMEOUT_DEFAULT,
     )
+    assert json.loads(mock_post.call_args.kwargs["data"]) == expected_json
 
 
 @patch("requests.post")
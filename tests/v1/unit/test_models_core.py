@@ -1,7 +1,9 @@
 import json
 
+import dapla_pseudo.v1.models.api  # noqa: F401 (registers the API models)
 from dapla_pseudo.constants import PseudoFunctionTypes
 from dapla_pseudo.constants import UnknownCharacterStrategy
+from dapla_pseudo.models import APIModel
 from dapla_pseudo.v1.models.core import DaeadKeywordArgs
 from dapla_pseudo.v1.models.core import FF31KeywordArgs
 from dapla_pseudo.v1.models.core import KeyWrapper
@@ -203,3 +205,27 @@ def test_deserialize_pseudo_config_with_redact_function() -> None:
             ]
         )
     )
+
+
+def test_pseudo_config_to_json_bytes() -> None:
+    pseudo_config = PseudoConfig(
+        rules=[
+            PseudoRule.from_json(
+                '{"name":"my-rule","pattern":"foo*","func":"redact(placeholder=#)"}'
+            )
+        ],
+        keysets=[PseudoKeyset.model_validate(custom_keyset_dict)],
+    )
+    assert pseudo_config.to_json_bytes() == pseudo_config.to_json().encode("utf-8")
+    assert json.loads(pseudo_config.to_json_bytes())["rules"] == [
+        {"name": "my-rule", "pattern": "foo*", "func": "redact(placeholder=#)"}
+    ]
+
+
+def test_api_model_optional_fields_default_to_none() -> None:
+    # APIModel.to_json_bytes relies on this to leave out unassigned fields
+    models = list(APIModel.__subclasses__())
+    for model in models:
+        models.extend(model.__subclasses__())
+        for name, field in model.model_fields.items():
+            assert field.is_required() or field.default is None, (model, name)